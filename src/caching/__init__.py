@@ -0,0 +1,121 @@
+"""
+Response Caching Module
+
+This module provides an exact-match response cache for LLM API calls.
+Identical questions (same model + prompting technique) are served from
+the cache instead of paying full network + LLM latency again.
+
+Cached entries are kept in memory via an LRU layer and persisted across
+runs with shelve at 'logs/exact_cache.db'.
+"""
+
+import functools
+import hashlib
+import shelve
+from pathlib import Path
+from typing import Dict, Optional
+
+# Default location for the persistent cache (next to the CSV logs)
+DEFAULT_CACHE_PATH = "logs/exact_cache.db"
+
+# Sentinel stored by the LRU layer for keys that are not in the cache
+_MISS = object()
+
+
+class ExactResponseCache:
+    """Exact-match cache keyed by SHA-256 of (model, technique, question)."""
+
+    def __init__(self, cache_path: str = DEFAULT_CACHE_PATH, maxsize: int = 1024):
+        """
+        Initialize the response cache.
+
+        Args:
+            cache_path: Path to the persistent shelve database
+            maxsize: Maximum number of entries kept in the in-memory LRU layer
+        """
+        self.cache_path = Path(cache_path)
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # In-memory LRU layer in front of the shelve reads
+        self._cached_read = functools.lru_cache(maxsize=maxsize)(self._read)
+
+        # Entries written during this run (avoids re-reading the shelve)
+        self._written: Dict[str, Dict] = {}
+
+    @staticmethod
+    def make_key(
+        model: str,
+        technique: str,
+        question: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """
+        Build a cache key from the call parameters.
+
+        The question is normalized (stripped and lowercased) so trivially
+        re-worded whitespace/case variants still hit the cache. Sampling
+        parameters are part of the key so answers produced under one
+        temperature/max_tokens configuration are never served under
+        another.
+
+        Args:
+            model: The LLM model identifier
+            technique: The prompting technique used
+            question: The user's question
+            temperature: Sampling temperature used for the call, if any
+            max_tokens: Response length cap used for the call, if any
+
+        Returns:
+            SHA-256 hex digest identifying the call
+        """
+        normalized = question.strip().lower()
+        raw = f"{model}|{technique}|{temperature}|{max_tokens}|{normalized}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _read(self, key: str):
+        """Read a key from the persistent store (wrapped by lru_cache)."""
+        try:
+            with shelve.open(str(self.cache_path)) as db:
+                return db.get(key, _MISS)
+        except OSError:
+            # Persistent store unavailable - treat as a miss
+            return _MISS
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            The cached response dictionary, or None on a miss
+        """
+        if key in self._written:
+            return self._written[key]
+
+        value = self._cached_read(key)
+        if value is _MISS:
+            return None
+        return value
+
+    def set(self, key: str, value: Dict) -> None:
+        """
+        Store a response in the cache.
+
+        Args:
+            key: Cache key from make_key()
+            value: Response dictionary to store (without metrics)
+        """
+        self._written[key] = value
+
+        try:
+            with shelve.open(str(self.cache_path)) as db:
+                db[key] = value
+        except OSError:
+            # Persistence failure should never break the request path
+            pass
+
+
+__all__ = ['ExactResponseCache', 'DEFAULT_CACHE_PATH']
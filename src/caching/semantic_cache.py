@@ -0,0 +1,144 @@
+"""
+Semantic Cache Module
+
+This module caches LLM responses by meaning rather than by exact text:
+the user question is embedded, searched against prior questions with
+FAISS, and if the best match is close enough (cosine similarity above a
+threshold) the cached response is returned without calling the LLM.
+
+The embedding model (sentence-transformers) and FAISS are optional
+dependencies; when they are not installed the cache reports itself as
+unavailable and callers fall through to the normal LLM path.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+    import faiss
+    from sentence_transformers import SentenceTransformer
+    DEPENDENCIES_AVAILABLE = True
+except ImportError:
+    DEPENDENCIES_AVAILABLE = False
+
+# Default locations for the persistent index and response store
+DEFAULT_INDEX_PATH = "logs/sem_cache.faiss"
+DEFAULT_STORE_PATH = "logs/sem_cache.json"
+
+# Embedding model and its output dimension
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+EMBEDDING_DIM = 384
+
+# Cosine similarity required to treat two questions as equivalent
+DEFAULT_THRESHOLD = 0.95
+
+
+class SemanticCache:
+    """Caches responses for semantically similar questions via FAISS."""
+
+    def __init__(
+        self,
+        index_path: str = DEFAULT_INDEX_PATH,
+        store_path: str = DEFAULT_STORE_PATH,
+        threshold: Optional[float] = None
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            index_path: Path to the persisted FAISS index
+            store_path: Path to the JSON file holding cached responses
+            threshold: Minimum cosine similarity for a hit
+                       (default: SEMANTIC_THRESHOLD env var or 0.95)
+        """
+        self.available = DEPENDENCIES_AVAILABLE
+        self.index_path = Path(index_path)
+        self.store_path = Path(store_path)
+
+        if threshold is None:
+            threshold = float(os.getenv("SEMANTIC_THRESHOLD",
+                                        str(DEFAULT_THRESHOLD)))
+        self.threshold = threshold
+
+        if not self.available:
+            return
+
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._model = SentenceTransformer(EMBEDDING_MODEL)
+
+        # Inner product over normalized vectors equals cosine similarity
+        if self.index_path.exists():
+            self._index = faiss.read_index(str(self.index_path))
+        else:
+            self._index = faiss.IndexFlatIP(EMBEDDING_DIM)
+
+        self._responses: List[Dict] = []
+        if self.store_path.exists():
+            self._responses = json.loads(
+                self.store_path.read_text(encoding="utf-8"))
+
+        # The index and the response store are persisted as two separate
+        # files; if one write failed or a file was deleted they can
+        # disagree, and a search hit would then point past the end of
+        # self._responses. Start fresh rather than serve wrong answers.
+        if self._index.ntotal != len(self._responses):
+            self._index = faiss.IndexFlatIP(EMBEDDING_DIM)
+            self._responses = []
+
+    def _embed(self, question: str):
+        """Embed a question as a normalized float32 row vector."""
+        vec = self._model.encode([question], convert_to_numpy=True)
+        vec = vec.astype(np.float32)
+        faiss.normalize_L2(vec)
+        return vec
+
+    def get(self, question: str) -> Optional[Dict]:
+        """
+        Look up a cached response for a semantically similar question.
+
+        Args:
+            question: The user's question
+
+        Returns:
+            Cached response dict with the match similarity attached,
+            or None when no stored question is close enough
+        """
+        if not self.available or self._index.ntotal == 0:
+            return None
+
+        vec = self._embed(question)
+        similarities, indices = self._index.search(vec, 1)
+
+        # Guard against index/store drift during this run as well
+        hit = int(indices[0, 0])
+        if similarities[0, 0] >= self.threshold and 0 <= hit < len(self._responses):
+            cached = dict(self._responses[hit])
+            cached["similarity"] = round(float(similarities[0, 0]), 4)
+            return cached
+
+        return None
+
+    def set(self, question: str, response: Dict) -> None:
+        """
+        Store a question/response pair and persist the cache.
+
+        Args:
+            question: The user's question
+            response: Response dictionary to cache (without metrics)
+        """
+        if not self.available:
+            return
+
+        vec = self._embed(question)
+        self._index.add(vec)
+        self._responses.append(response)
+
+        faiss.write_index(self._index, str(self.index_path))
+        self.store_path.write_text(
+            json.dumps(self._responses), encoding="utf-8")
+
+
+__all__ = ['SemanticCache', 'DEPENDENCIES_AVAILABLE']
@@ -14,31 +14,66 @@ CSV files are stored in a 'logs' directory with the following structure:
 - logs/adversarial.csv: Adversarial prompt detection logs
 """
 
+import atexit
 import csv
+import os
+import sys
+import queue
 import threading
+import time
 import re
-from datetime import datetime
 from typing import Dict, Optional, Any
 from pathlib import Path
 
+# One C-level pass replaces the chained .replace calls when stripping
+# newlines out of a field (stack traces are the long ones)
+_NEWLINE_TRANS = str.maketrans({'\n': ' ', '\r': ' '})
+
+# Cached (second, formatted prefix) pair for timestamp formatting; rows
+# logged within the same second reuse one strftime result. Each logger
+# instance runs its own writer thread, so the tuple is snapshotted into
+# a local before use - tuple assignment is atomic, and the worst case
+# under racing writers is a redundant strftime, never a torn prefix.
+_TS_CACHE = (0, "")
+
+
+def _format_timestamp(ts: float) -> str:
+    """Format a time.time() float as UTC ISO-8601 with milliseconds."""
+    global _TS_CACHE
+    sec = int(ts)
+    cached_sec, prefix = _TS_CACHE
+    if cached_sec != sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _TS_CACHE = (sec, prefix)
+    millis = int(ts * 1000) - sec * 1000
+    return f"{prefix}.{millis:03d}+00:00"
+
 
 class CSVLogger:
     """Thread-safe CSV logger for metrics, errors, and events."""
 
-    def __init__(self, log_dir: str = "logs"):
+    def __init__(self, log_dir: str = "logs", durable: bool = False):
         """
         Initialize the CSV logger.
 
         Args:
             log_dir: Directory to store log files (default: 'logs')
+            durable: When True, fsync the log files on flush()/close()
+                so rows survive an OS crash; never done per row
         """
         self.log_dir = Path(log_dir)
+        self.durable = durable
         self.lock = threading.Lock()
 
         # Determine project root for path sanitization
         # Navigate up from the logs directory to find project root
         self.project_root = Path.cwd()
 
+        # Pattern to match file paths in stack traces, compiled once
+        # Matches quoted paths: File "/absolute/path/to/file.py", line X
+        self._path_re = re.compile(r'File "([^"]+)"')
+        self._project_root_str = str(self.project_root)
+
         # Create logs directory if it doesn't exist
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
@@ -50,11 +85,44 @@ class CSVLogger:
         # Initialize log files with headers if they don't exist
         self._initialize_logs()
 
+        # Entry counters so get_stats is O(1) instead of re-reading each
+        # CSV; seeded once from any rows already on disk
+        self._counts = {
+            "metrics_entries": self._count_existing_rows(self.metrics_log),
+            "error_entries": self._count_existing_rows(self.errors_log),
+            "adversarial_entries": self._count_existing_rows(
+                self.adversarial_log)
+        }
+
+        # Keep one appending file handle (and csv.writer) per log file so
+        # rows don't pay an open/close per line, and drain queued rows on
+        # a single background writer thread
+        self._files = {}
+        self._writers = {}
+        # One lock per log file so writer-thread appends and flush()
+        # calls on different streams never serialize against each other
+        self._file_locks = {}
+        for path in (self.metrics_log, self.errors_log, self.adversarial_log):
+            fh = open(path, 'a', newline='', encoding='utf-8',
+                      buffering=64 * 1024)
+            self._files[path] = fh
+            self._writers[path] = csv.writer(fh)
+            self._file_locks[path] = threading.Lock()
+
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = False
+        self._writer_thread = threading.Thread(
+            target=self._drain, daemon=True)
+        self._writer_thread.start()
+
+        # Make sure buffered rows reach disk on interpreter exit
+        atexit.register(self.close)
+
     def _initialize_logs(self) -> None:
         """Initialize log files with headers if they don't exist."""
         # Metrics log headers
         if not self.metrics_log.exists():
-            self._write_csv_row(
+            self._write_header(
                 self.metrics_log,
                 [
                     "timestamp",
@@ -71,7 +139,7 @@ class CSVLogger:
 
         # Errors log headers
         if not self.errors_log.exists():
-            self._write_csv_row(
+            self._write_header(
                 self.errors_log,
                 [
                     "timestamp",
@@ -85,7 +153,7 @@ class CSVLogger:
 
         # Adversarial log headers
         if not self.adversarial_log.exists():
-            self._write_csv_row(
+            self._write_header(
                 self.adversarial_log,
                 [
                     "timestamp",
@@ -95,6 +163,23 @@ class CSVLogger:
                 ]
             )
 
+    def _replace_path(self, match) -> str:
+        """Rewrite a single 'File "..."' match to a safe path."""
+        abs_path = match.group(1)
+        project_root_str = self._project_root_str
+
+        # Check if path is in venv or external libraries first
+        if 'venv' in abs_path or 'site-packages' in abs_path or '/opt/' in abs_path or '/usr/' in abs_path:
+            # External library - anonymize it by default
+            pass
+        # If path starts with project root, make it relative
+        elif abs_path.startswith(project_root_str):
+            rel_path = abs_path[len(project_root_str):].lstrip('/')
+            return f'File "./{rel_path}"'
+        # Any other absolute path - anonymize it
+        filename = Path(abs_path).name
+        return f'File "<external>/{filename}"'
+
     def _sanitize_path(self, text: str) -> str:
         """
         Sanitize file paths in text to prevent exposing system information.
@@ -106,31 +191,11 @@ class CSVLogger:
         Returns:
             Text with absolute paths replaced by relative paths
         """
-        # Get the absolute project root path as string
-        project_root_str = str(self.project_root)
+        # Most fields carry no stack trace - skip the regex entirely
+        if 'File "' not in text:
+            return text
 
-        # Pattern to match file paths in stack traces
-        # Matches quoted paths: File "/absolute/path/to/file.py", line X
-        path_pattern = r'File "([^"]+)"'
-
-        def replace_path(match):
-            abs_path = match.group(1)
-
-            # Check if path is in venv or external libraries first
-            if 'venv' in abs_path or 'site-packages' in abs_path or '/opt/' in abs_path or '/usr/' in abs_path:
-                # External library - anonymize it by default
-                pass
-            # If path starts with project root, make it relative
-            elif abs_path.startswith(project_root_str):
-                rel_path = abs_path[len(project_root_str):].lstrip('/')
-                return f'File "./{rel_path}"'
-            # Any other absolute path - anonymize it
-            filename = Path(abs_path).name
-            return f'File "<external>/{filename}"'
-
-        # Replace all file paths in the text
-        sanitized = re.sub(path_pattern, replace_path, text)
-        return sanitized
+        return self._path_re.sub(self._replace_path, text)
 
     def _sanitize_field(self, field: Any) -> str:
         """
@@ -142,32 +207,118 @@ class CSVLogger:
         Returns:
             Sanitized string with newlines replaced by spaces and paths sanitized
         """
+        # Numbers and booleans can't contain paths or newlines - skip the
+        # whole sanitization chain (bool first: it's an int subclass)
+        if isinstance(field, bool):
+            return 'True' if field else 'False'
+        if isinstance(field, (int, float)):
+            return str(field)
+        if field is None:
+            return ''
+
         # Convert to string
         field_str = str(field)
         # Sanitize file paths to prevent exposing system information
         field_str = self._sanitize_path(field_str)
         # Replace newlines with spaces
-        field_str = field_str.replace('\n', ' ').replace('\r', ' ')
+        if '\n' in field_str or '\r' in field_str:
+            field_str = field_str.translate(_NEWLINE_TRANS)
         # Remove excessive whitespace
-        field_str = ' '.join(field_str.split())
+        if '  ' in field_str:
+            field_str = ' '.join(field_str.split())
         return field_str
 
-    def _write_csv_row(self, file_path: Path, row: list) -> None:
+    @staticmethod
+    def _count_existing_rows(file_path: Path) -> int:
+        """Count data rows (excluding the header) already in a log file."""
+        if not file_path.exists():
+            return 0
+        with open(file_path, 'r') as f:
+            return max(sum(1 for _ in f) - 1, 0)
+
+    def _write_header(self, file_path: Path, row: list) -> None:
         """
-        Thread-safe write of a single row to CSV file.
-        Sanitizes all fields to remove newlines.
+        Write a header row directly to a CSV file.
+
+        Only used during initialization, before the persistent file
+        handles and writer thread exist.
 
         Args:
             file_path: Path to the CSV file
-            row: List of values to write
+            row: List of header names to write
         """
-        # Sanitize all fields in the row
-        sanitized_row = [self._sanitize_field(field) for field in row]
+        with open(file_path, 'a', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerow(row)
 
-        with self.lock:
-            with open(file_path, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(sanitized_row)
+    def _write_csv_row(self, file_path: Path, row: tuple) -> None:
+        """
+        Sanitize a row and hand it to the background writer thread.
+
+        Args:
+            file_path: Path to the CSV file
+            row: Tuple of values to write, ordered to match the header
+        """
+        # Sanitize all fields in the row; a float timestamp in the first
+        # column stays raw so the writer thread can format it lazily
+        first = row[0]
+        if not isinstance(first, float):
+            first = self._sanitize_field(first)
+        sanitized_row = [first] + \
+            [self._sanitize_field(field) for field in row[1:]]
+
+        self._queue.put((file_path, sanitized_row))
+
+    def _drain(self) -> None:
+        """Drain queued rows onto the persistent file handles.
+
+        Runs on the daemon writer thread. Handles are flushed whenever
+        the queue empties so readers see complete batches, not per-row
+        syscalls.
+        """
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                break
+
+            file_path, row = item
+
+            # Timestamps are captured as time.time() floats on the hot
+            # path and only formatted here, off the caller's thread
+            if row and isinstance(row[0], float):
+                row[0] = _format_timestamp(row[0])
+
+            with self._file_locks[file_path]:
+                self._writers[file_path].writerow(row)
+                if self._queue.empty():
+                    self._files[file_path].flush()
+            self._queue.task_done()
+
+    def flush(self) -> None:
+        """Block until all queued rows are written and flushed to disk."""
+        self._queue.join()
+        for path, fh in self._files.items():
+            with self._file_locks[path]:
+                if not fh.closed:
+                    fh.flush()
+                    if self.durable:
+                        os.fsync(fh.fileno())
+
+    def close(self) -> None:
+        """Flush pending rows, stop the writer thread, and close files."""
+        if self._closed:
+            return
+        self._closed = True
+
+        self._queue.put(None)
+        self._writer_thread.join(timeout=5)
+        for path, fh in self._files.items():
+            with self._file_locks[path]:
+                if not fh.closed:
+                    fh.flush()
+                    if self.durable:
+                        os.fsync(fh.fileno())
+                    fh.close()
 
     def log_metrics(
         self,
@@ -193,9 +344,17 @@ class CSVLogger:
             prompt_technique: Prompting technique used
             success: Whether the API call succeeded
         """
-        timestamp = datetime.now().isoformat()
+        timestamp = time.time()
 
-        row = [
+        # model and prompt_technique come from a small fixed vocabulary,
+        # so interning keeps one shared object per value in the queue
+        # instead of N per-row copies
+        if isinstance(model, str):
+            model = sys.intern(model)
+        if isinstance(prompt_technique, str):
+            prompt_technique = sys.intern(prompt_technique)
+
+        row = (
             timestamp,
             model,
             latency_ms,
@@ -205,9 +364,11 @@ class CSVLogger:
             cost_usd,
             prompt_technique,
             success
-        ]
+        )
 
         self._write_csv_row(self.metrics_log, row)
+        with self.lock:
+            self._counts["metrics_entries"] += 1
 
     def log_error(
         self,
@@ -227,18 +388,20 @@ class CSVLogger:
             user_question: User question that caused the error (if applicable)
             stack_trace: Full stack trace (if available)
         """
-        timestamp = datetime.now().isoformat()
+        timestamp = time.time()
 
-        row = [
+        row = (
             timestamp,
             error_type,
             error_message,
             model or "N/A",
             user_question or "N/A",
             stack_trace or "N/A"
-        ]
+        )
 
         self._write_csv_row(self.errors_log, row)
+        with self.lock:
+            self._counts["error_entries"] += 1
 
     def log_adversarial(
         self,
@@ -252,19 +415,21 @@ class CSVLogger:
             user_question: The user's question that triggered detection
             detected_patterns: List of detected adversarial patterns
         """
-        timestamp = datetime.now().isoformat()
+        timestamp = time.time()
 
         # Join patterns into a single string for CSV storage
         patterns_str = " | ".join(detected_patterns)
 
-        row = [
+        row = (
             timestamp,
             user_question,
             patterns_str,
             len(detected_patterns)
-        ]
+        )
 
         self._write_csv_row(self.adversarial_log, row)
+        with self.lock:
+            self._counts["adversarial_entries"] += 1
 
     def log_metrics_from_tracker(
         self,
@@ -298,26 +463,7 @@ class CSVLogger:
         Returns:
             Dictionary with counts of logged entries
         """
-        stats = {
-            "metrics_entries": 0,
-            "error_entries": 0,
-            "adversarial_entries": 0
-        }
-
-        # Count lines in each log file (excluding header)
-        if self.metrics_log.exists():
-            with open(self.metrics_log, 'r') as f:
-                stats["metrics_entries"] = sum(1 for _ in f) - 1
-
-        if self.errors_log.exists():
-            with open(self.errors_log, 'r') as f:
-                stats["error_entries"] = sum(1 for _ in f) - 1
-
-        if self.adversarial_log.exists():
-            with open(self.adversarial_log, 'r') as f:
-                stats["adversarial_entries"] = sum(1 for _ in f) - 1
-
-        return stats
+        return dict(self._counts)
 
 
 # Global logger instance (singleton pattern)
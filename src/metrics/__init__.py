@@ -39,6 +39,19 @@ MODEL_PRICING = {
 class MetricsTracker:
     """Tracks metrics for LLM API calls."""
 
+    # One tracker is allocated per request, so skip the per-instance
+    # __dict__ in favor of fixed slots
+    __slots__ = (
+        "model",
+        "start_time",
+        "end_time",
+        "prompt_tokens",
+        "completion_tokens",
+        "total_tokens",
+        "_pricing",
+        "_cached_cost",
+    )
+
     def __init__(self, model: str = "openai/gpt-3.5-turbo"):
         """
         Initialize the metrics tracker.
@@ -47,19 +60,26 @@ class MetricsTracker:
             model: The model identifier being used
         """
         self.model = model
-        self.start_time: Optional[float] = None
-        self.end_time: Optional[float] = None
+        self.start_time: Optional[int] = None
+        self.end_time: Optional[int] = None
         self.prompt_tokens: int = 0
         self.completion_tokens: int = 0
         self.total_tokens: int = 0
+        # Pricing is fixed per tracker, so resolve it once here; the
+        # cost itself is memoized since get_metrics and
+        # get_summary_metrics both ask for it per request
+        self._pricing = MODEL_PRICING.get(model, MODEL_PRICING["default"])
+        self._cached_cost: Optional[float] = None
 
     def start(self) -> None:
         """Start tracking latency."""
-        self.start_time = time.time()
+        # Monotonic integer nanoseconds: immune to NTP clock steps and
+        # cheaper than the float wall-clock read
+        self.start_time = time.perf_counter_ns()
 
     def stop(self) -> None:
         """Stop tracking latency."""
-        self.end_time = time.time()
+        self.end_time = time.perf_counter_ns()
 
     def set_token_usage(self, prompt_tokens: int, completion_tokens: int, total_tokens: int) -> None:
         """
@@ -73,6 +93,7 @@ class MetricsTracker:
         self.prompt_tokens = prompt_tokens
         self.completion_tokens = completion_tokens
         self.total_tokens = total_tokens
+        self._cached_cost = None
 
     def get_latency_ms(self) -> int:
         """
@@ -84,8 +105,7 @@ class MetricsTracker:
         if self.start_time is None or self.end_time is None:
             return 0
 
-        latency_seconds = self.end_time - self.start_time
-        return round(latency_seconds * 1000)
+        return (self.end_time - self.start_time) // 1_000_000
 
     def calculate_cost(self) -> float:
         """
@@ -94,15 +114,15 @@ class MetricsTracker:
         Returns:
             Estimated cost in USD (rounded to 5 decimal places)
         """
-        # Get pricing for the model or use default
-        pricing = MODEL_PRICING.get(self.model, MODEL_PRICING["default"])
-
-        # Calculate costs
-        prompt_cost = (self.prompt_tokens / 1000) * pricing.prompt_price_per_1k
-        completion_cost = (self.completion_tokens / 1000) * pricing.completion_price_per_1k
-        total_cost = prompt_cost + completion_cost
-
-        return round(total_cost, 5)
+        if self._cached_cost is None:
+            pricing = self._pricing
+            prompt_cost = (self.prompt_tokens / 1000) * \
+                pricing.prompt_price_per_1k
+            completion_cost = (self.completion_tokens / 1000) * \
+                pricing.completion_price_per_1k
+            self._cached_cost = round(prompt_cost + completion_cost, 5)
+
+        return self._cached_cost
 
     def get_metrics(self) -> Dict[str, any]:
         """
@@ -8,14 +8,69 @@ of LLM responses. Uses few-shot prompting to guide the model's output format.
 from pathlib import Path
 from typing import List, Dict
 
+# Read the system prompt once at import time; every call used to re-read
+# the file from disk
+_SYSTEM_PROMPT = Path(__file__).with_name(
+    "system_prompt.txt").read_text(encoding="utf-8").strip()
+
+# Few-shot example turns are identical for every question, so the prefix
+# is a module-level tuple (immutable, shared) and each call only appends
+# the final user turn
+_FEW_SHOT_MESSAGES = (
+    {
+        "role": "system",
+        "content": _SYSTEM_PROMPT
+    },
+    {
+        "role": "user",
+        "content": "What is the capital of France?"
+    },
+    {
+        "role": "assistant",
+        "content": '{"answer": "Paris"}'
+    },
+    {
+        "role": "user",
+        "content": "What is 2 + 2?"
+    },
+    {
+        "role": "assistant",
+        "content": '{"answer": "4"}'
+    },
+    {
+        "role": "user",
+        "content": "Who wrote Romeo and Juliet?"
+    },
+    {
+        "role": "assistant",
+        "content": '{"answer": "William Shakespeare"}'
+    }
+)
+
+# Pre-concatenated system strings for the other techniques so no string
+# building happens per call
+_SIMPLE_SYSTEM = _SYSTEM_PROMPT + \
+    "\nRespond with JSON in this format: {\"answer\": \"your answer here\"}"
+
+_COT_SYSTEM = _SYSTEM_PROMPT + """
+
+When answering complex questions, break down your reasoning step by step.
+Always provide your final answer in JSON format: {"answer": "your answer", "reasoning": "brief explanation"}"""
+
+_BATCH_SYSTEM = _SYSTEM_PROMPT + """
+
+You will receive several numbered questions in one message.
+Answer every question. Respond with JSON in this format:
+{"answers": [{"id": 1, "answer": "first answer"}, {"id": 2, "answer": "second answer"}]}
+Include exactly one entry per question, keyed by its number."""
+
 
 class PromptBuilder:
     """Builds engineered prompts using simple, few-shot and chain-of-thought techniques."""
 
     def __init__(self):
         """Initialize the prompt builder with system instructions."""
-        prompt_path = Path(__file__).with_name("system_prompt.txt")
-        self.system_prompt = prompt_path.read_text(encoding="utf-8").strip()
+        self.system_prompt = _SYSTEM_PROMPT
 
     def build_few_shot_prompt(self, user_question: str) -> List[Dict[str, str]]:
         """
@@ -25,6 +80,18 @@ class PromptBuilder:
         examples of the desired input-output format to improve consistency
         and quality of responses.
 
+        Args:
+            user_question: The user's question to answer
+
+        Returns:
+            List of message dictionaries formatted for the OpenRouter API
+        """
+        return [*_FEW_SHOT_MESSAGES, {"role": "user", "content": user_question}]
+
+    def build_simple_prompt(self, user_question: str) -> List[Dict[str, str]]:
+        """
+        Build a simple prompt without examples.
+
         Args:
             user_question: The user's question to answer
 
@@ -34,31 +101,7 @@ class PromptBuilder:
         messages = [
             {
                 "role": "system",
-                "content": self.system_prompt
-            },
-            {
-                "role": "user",
-                "content": "What is the capital of France?"
-            },
-            {
-                "role": "assistant",
-                "content": '{"answer": "Paris"}'
-            },
-            {
-                "role": "user",
-                "content": "What is 2 + 2?"
-            },
-            {
-                "role": "assistant",
-                "content": '{"answer": "4"}'
-            },
-            {
-                "role": "user",
-                "content": "Who wrote Romeo and Juliet?"
-            },
-            {
-                "role": "assistant",
-                "content": '{"answer": "William Shakespeare"}'
+                "content": _SIMPLE_SYSTEM
             },
             {
                 "role": "user",
@@ -68,9 +111,12 @@ class PromptBuilder:
 
         return messages
 
-    def build_simple_prompt(self, user_question: str) -> List[Dict[str, str]]:
+    def build_chain_of_thought_prompt(self, user_question: str) -> List[Dict[str, str]]:
         """
-        Build a simple prompt without examples.
+        Build a chain-of-thought prompt for complex reasoning.
+
+        This technique encourages the model to show its reasoning process
+        before providing the final answer.
 
         Args:
             user_question: The user's question to answer
@@ -81,7 +127,7 @@ class PromptBuilder:
         messages = [
             {
                 "role": "system",
-                "content": self.system_prompt + "\nRespond with JSON in this format: {\"answer\": \"your answer here\"}"
+                "content": _COT_SYSTEM
             },
             {
                 "role": "user",
@@ -91,38 +137,42 @@ class PromptBuilder:
 
         return messages
 
-    def build_chain_of_thought_prompt(self, user_question: str) -> List[Dict[str, str]]:
+    def build_batch_prompt(self, questions: List[str]) -> List[Dict[str, str]]:
         """
-        Build a chain-of-thought prompt for complex reasoning.
+        Build a prompt that packs several questions into one request.
 
-        This technique encourages the model to show its reasoning process
-        before providing the final answer.
+        Prompt stuffing trades a slightly larger prompt for one API call
+        instead of N, which matters when throughput is capped by
+        requests-per-minute rather than latency.
 
         Args:
-            user_question: The user's question to answer
+            questions: The user questions to answer in one call
 
         Returns:
             List of message dictionaries formatted for the OpenRouter API
         """
-        enhanced_system_prompt = self.system_prompt + """
-
-When answering complex questions, break down your reasoning step by step.
-Always provide your final answer in JSON format: {"answer": "your answer", "reasoning": "brief explanation"}"""
+        numbered = "\n".join(
+            f"{i}. {question}" for i, question in enumerate(questions, 1))
 
         messages = [
             {
                 "role": "system",
-                "content": enhanced_system_prompt
+                "content": _BATCH_SYSTEM
             },
             {
                 "role": "user",
-                "content": user_question
+                "content": numbered
             }
         ]
 
         return messages
 
 
+# Module-level singleton so create_prompt does not rebuild the builder
+# (and its few-shot prefix) on every call
+_BUILDER = PromptBuilder()
+
+
 def create_prompt(user_question: str, technique: str = "few_shot") -> List[Dict[str, str]]:
     """
     Convenience function to create a prompt using specified technique.
@@ -134,14 +184,25 @@ def create_prompt(user_question: str, technique: str = "few_shot") -> List[Dict[
     Returns:
         List of formatted messages for the API
     """
-    builder = PromptBuilder()
-
     if technique == "few_shot":
-        return builder.build_few_shot_prompt(user_question)
+        return _BUILDER.build_few_shot_prompt(user_question)
     elif technique == "simple":
-        return builder.build_simple_prompt(user_question)
+        return _BUILDER.build_simple_prompt(user_question)
     elif technique == "chain_of_thought":
-        return builder.build_chain_of_thought_prompt(user_question)
+        return _BUILDER.build_chain_of_thought_prompt(user_question)
     else:
         # Default to few_shot
-        return builder.build_few_shot_prompt(user_question)
+        return _BUILDER.build_few_shot_prompt(user_question)
+
+
+def create_batch_prompt(questions: List[str]) -> List[Dict[str, str]]:
+    """
+    Convenience function to create a prompt-stuffed batch prompt.
+
+    Args:
+        questions: The user questions to pack into one request
+
+    Returns:
+        List of formatted messages for the API
+    """
+    return _BUILDER.build_batch_prompt(questions)
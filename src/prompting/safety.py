@@ -7,47 +7,104 @@ other adversarial patterns.
 """
 
 import re
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from logging_mod import log_adversarial
 
+try:
+    # Optional: JIT'd multi-pattern DFA that scans all patterns in one
+    # pass (pip install hyperscan); stdlib re is used when absent
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Every adversarial regex requires at least one of these literal
+# substrings, so inputs containing none of them can skip the regex sweep
+# entirely. Anchors may over-match (e.g. 'act' in 'practices') - that
+# only means the full regex set runs and correctly rejects.
+_LITERAL_ANCHORS = (
+    "instruction",
+    "system",
+    "prompt",
+    "reveal",
+    "password",
+    "credential",
+    "token",
+    "key",
+    "database",
+    "variable",
+    "now",
+    "act",
+    "pretend",
+    "simulate",
+    "roleplay",
+)
+
+# Refuse to scan absurdly large inputs instead of feeding them to the
+# regex engine (argv is joined unbounded)
+MAX_INPUT_LENGTH = 10_000_000
+
+
+# Patterns for prompt injection attempts
+_INJECTION_PATTERNS = (
+    r'ignore\s+.*?\binstructions?\b',
+    r'forget\s+.*?\binstructions?\b',
+    r'disregard\s+.*?\binstructions?\b',
+    r'override\s+.*?\binstructions?\b',
+    r'new\s+instructions?:',
+    r'system\s+prompt',
+    r'reveal\s+(your\s+)?(system|instructions?|prompt)',
+    r'show\s+(me\s+)?(your\s+)?(system|instructions?|prompt)',
+    r'what\s+(are|is)\s+(your\s+)?(system|instructions?|prompt)',
+)
+
+# Patterns for sensitive information requests
+_SENSITIVE_PATTERNS = (
+    r'(api|secret|private)\s+key',
+    r'password',
+    r'credentials?',
+    r'access\s+token',
+    r'authentication\s+token',
+    r'database\s+connection',
+    r'env(ironment)?\s+variable',
+)
+
+# Patterns for role manipulation
+_ROLE_MANIPULATION_PATTERNS = (
+    r'you\s+are\s+now',
+    r'act\s+as\s+(a\s+)?',
+    r'pretend\s+(to\s+be|you\s+are)',
+    r'simulate\s+(a\s+)?',
+    r'roleplay\s+as',
+)
+
+
+def _compile_category(label: str, patterns: Tuple[str, ...]):
+    """
+    Compile a pattern category once: a single alternation regex for the
+    common no-match scan plus per-pattern regexes for attribution.
+
+    The patterns are all-lowercase, so detect() folds the input once and
+    matches without IGNORECASE instead of case-folding twice. \\s and
+    \\b stay in Unicode mode on purpose: attacker input is not ASCII
+    constrained, and "ignore\\xa0all instructions" with NBSP separators
+    must still match.
+    """
+    union = re.compile("|".join(f"(?:{p})" for p in patterns))
+    compiled = tuple(re.compile(p) for p in patterns)
+    return label, union, compiled
+
 
 class AdversarialPromptDetector:
     """Detects adversarial patterns in user prompts."""
 
-    def __init__(self):
-        """Initialize the detector with adversarial patterns."""
-        # Patterns for prompt injection attempts
-        self.injection_patterns = [
-            r'ignore\s+.*?\binstructions?\b',
-            r'forget\s+.*?\binstructions?\b',
-            r'disregard\s+.*?\binstructions?\b',
-            r'override\s+.*?\binstructions?\b',
-            r'new\s+instructions?:',
-            r'system\s+prompt',
-            r'reveal\s+(your\s+)?(system|instructions?|prompt)',
-            r'show\s+(me\s+)?(your\s+)?(system|instructions?|prompt)',
-            r'what\s+(are|is)\s+(your\s+)?(system|instructions?|prompt)',
-        ]
-
-        # Patterns for sensitive information requests
-        self.sensitive_patterns = [
-            r'(api|secret|private)\s+key',
-            r'password',
-            r'credentials?',
-            r'access\s+token',
-            r'authentication\s+token',
-            r'database\s+connection',
-            r'env(ironment)?\s+variable',
-        ]
-
-        # Patterns for role manipulation
-        self.role_manipulation_patterns = [
-            r'you\s+are\s+now',
-            r'act\s+as\s+(a\s+)?',
-            r'pretend\s+(to\s+be|you\s+are)',
-            r'simulate\s+(a\s+)?',
-            r'roleplay\s+as',
-        ]
+    # Compiled once at class-definition time; each category is scanned
+    # with one C-level alternation search, and the per-pattern regexes
+    # only run on the rare input that actually matched something
+    _CATEGORIES = (
+        _compile_category("Prompt injection", _INJECTION_PATTERNS),
+        _compile_category("Sensitive info request", _SENSITIVE_PATTERNS),
+        _compile_category("Role manipulation", _ROLE_MANIPULATION_PATTERNS),
+    )
 
     def detect(self, user_input: str) -> Tuple[bool, List[str]]:
         """
@@ -62,24 +119,52 @@ class AdversarialPromptDetector:
         detected_patterns = []
         user_input_lower = user_input.lower()
 
-        # Check for prompt injection
-        for pattern in self.injection_patterns:
-            if re.search(pattern, user_input_lower, re.IGNORECASE):
-                detected_patterns.append(f"Prompt injection: {pattern}")
-
-        # Check for sensitive information requests
-        for pattern in self.sensitive_patterns:
-            if re.search(pattern, user_input_lower, re.IGNORECASE):
-                detected_patterns.append(f"Sensitive info request: {pattern}")
+        # Fast reject: no literal anchor means no pattern can match
+        if not any(anchor in user_input_lower for anchor in _LITERAL_ANCHORS):
+            return False, detected_patterns
 
-        # Check for role manipulation
-        for pattern in self.role_manipulation_patterns:
-            if re.search(pattern, user_input_lower, re.IGNORECASE):
-                detected_patterns.append(f"Role manipulation: {pattern}")
+        for label, union, compiled in self._CATEGORIES:
+            if union.search(user_input_lower) is None:
+                continue
+            for regex in compiled:
+                if regex.search(user_input_lower):
+                    detected_patterns.append(f"{label}: {regex.pattern}")
 
         is_adversarial = len(detected_patterns) > 0
         return is_adversarial, detected_patterns
 
+    def detect_any(self, user_input: str) -> Optional[str]:
+        """
+        Return the first adversarial pattern found, or None.
+
+        Short-circuit variant of detect() for the request path, which
+        only needs to know whether the input is adversarial: it stops at
+        the first match instead of sweeping all three categories.
+
+        Args:
+            user_input: The user's input text to analyze
+
+        Returns:
+            Description of the first matched pattern, or None
+        """
+        user_input_lower = user_input.lower()
+
+        if not any(anchor in user_input_lower for anchor in _LITERAL_ANCHORS):
+            return None
+
+        # One DFA pass over all patterns when Hyperscan is installed;
+        # a clean verdict skips the per-category sweep entirely
+        if _hyperscan_verdict(user_input_lower) is False:
+            return None
+
+        for label, union, compiled in self._CATEGORIES:
+            if union.search(user_input_lower) is None:
+                continue
+            for regex in compiled:
+                if regex.search(user_input_lower):
+                    return f"{label}: {regex.pattern}"
+        return None
+
     def get_safe_response(self) -> Dict[str, str]:
         """
         Return a safe error response for adversarial prompts.
@@ -92,6 +177,55 @@ class AdversarialPromptDetector:
         }
 
 
+def _build_hyperscan_db():
+    """
+    Compile every adversarial pattern into one Hyperscan database, or
+    return None when the optional dependency is missing or rejects a
+    pattern. The database only yields a match/no-match verdict
+    (HS_FLAG_SINGLEMATCH); attribution still uses the compiled regexes.
+    """
+    if hyperscan is None:
+        return None
+    patterns = (_INJECTION_PATTERNS
+                + _SENSITIVE_PATTERNS
+                + _ROLE_MANIPULATION_PATTERNS)
+    db = hyperscan.Database()
+    try:
+        db.compile(
+            expressions=[p.encode() for p in patterns],
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(patterns)
+        )
+    except hyperscan.error:
+        return None
+    return db
+
+
+_HYPERSCAN_DB = _build_hyperscan_db()
+
+
+def _hyperscan_verdict(text_lower: str) -> Optional[bool]:
+    """
+    Single-pass scan over all patterns; True/False when Hyperscan is
+    available, None to fall back to the per-category regexes.
+    """
+    if _HYPERSCAN_DB is None:
+        return None
+    matched: List[int] = []
+    try:
+        _HYPERSCAN_DB.scan(
+            text_lower.encode(),
+            match_event_handler=lambda pat_id, *args: matched.append(pat_id)
+        )
+    except hyperscan.error:
+        return None
+    return bool(matched)
+
+
+# Shared stateless instance; safe across threads since detect() only
+# reads class-level compiled patterns
+_DETECTOR = AdversarialPromptDetector()
+
+
 def check_adversarial_prompt(user_input: str) -> Tuple[bool, Dict]:
     """
     Convenience function to check if a prompt is adversarial.
@@ -102,15 +236,20 @@ def check_adversarial_prompt(user_input: str) -> Tuple[bool, Dict]:
     Returns:
         Tuple of (is_adversarial, response_dict)
     """
-    detector = AdversarialPromptDetector()
-    is_adversarial, patterns = detector.detect(user_input)
+    # Oversized inputs are rejected outright rather than scanned
+    if len(user_input) > MAX_INPUT_LENGTH:
+        return True, {"error": "Input exceeds maximum allowed length"}
+
+    # The request path only needs a verdict, so stop at the first match;
+    # the single pattern found is enough for the CSV row
+    detected = _DETECTOR.detect_any(user_input)
 
-    if is_adversarial:
+    if detected is not None:
         # Log the adversarial detection event to CSV
         log_adversarial(
             user_question=user_input,
-            detected_patterns=patterns
+            detected_patterns=[detected]
         )
-        return True, detector.get_safe_response()
+        return True, _DETECTOR.get_safe_response()
 
     return False, {}
@@ -0,0 +1,56 @@
+"""
+Unit tests for the semantic cache module.
+Tests are skipped when the optional dependencies are not installed.
+"""
+
+import pytest
+from caching.semantic_cache import SemanticCache, DEPENDENCIES_AVAILABLE
+
+
+def test_unavailable_cache_is_inert(tmp_path):
+    """Test that the cache degrades to a no-op without its dependencies."""
+    if DEPENDENCIES_AVAILABLE:
+        pytest.skip("optional dependencies installed")
+
+    cache = SemanticCache(
+        index_path=str(tmp_path / "idx.faiss"),
+        store_path=str(tmp_path / "store.json")
+    )
+    assert not cache.available
+    assert cache.get("What is the capital of France?") is None
+    # set() should not raise either
+    cache.set("What is the capital of France?", {"answer": "Paris"})
+
+
+@pytest.mark.skipif(not DEPENDENCIES_AVAILABLE,
+                    reason="requires sentence-transformers and faiss")
+def test_near_duplicate_hit(tmp_path):
+    """Test that a paraphrased question hits the cache."""
+    cache = SemanticCache(
+        index_path=str(tmp_path / "idx.faiss"),
+        store_path=str(tmp_path / "store.json"),
+        threshold=0.8
+    )
+    cache.set("What is the capital of France?", {"answer": "Paris"})
+
+    hit = cache.get("France's capital?")
+    assert hit is not None
+    assert hit["answer"] == "Paris"
+    assert hit["similarity"] >= 0.8
+
+
+@pytest.mark.skipif(not DEPENDENCIES_AVAILABLE,
+                    reason="requires sentence-transformers and faiss")
+def test_unrelated_question_misses(tmp_path):
+    """Test that an unrelated question does not hit the cache."""
+    cache = SemanticCache(
+        index_path=str(tmp_path / "idx.faiss"),
+        store_path=str(tmp_path / "store.json")
+    )
+    cache.set("What is the capital of France?", {"answer": "Paris"})
+
+    assert cache.get("How do I bake a cake?") is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,20 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+import main
+
+
+@pytest.fixture(autouse=True)
+def fresh_config():
+    """
+    Clear the cached environment config around every test.
+
+    get_config() parses the environment once per process, but tests
+    patch os.environ per test case and must each see their own values.
+    """
+    main.get_config.cache_clear()
+    yield
+    main.get_config.cache_clear()
@@ -4,12 +4,25 @@ Tests for the logging module.
 
 import pytest
 import csv
+import io
+import mmap
 import tempfile
 import shutil
 from pathlib import Path
 from logging_mod import CSVLogger, get_logger
 
 
+def _read_rows(path):
+    """Read a CSV file once via mmap and return its rows as dicts."""
+    with open(path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            text = mm[:].decode('utf-8')
+        finally:
+            mm.close()
+    return list(csv.DictReader(io.StringIO(text)))
+
+
 @pytest.fixture
 def temp_log_dir():
     """Create a temporary directory for log files."""
@@ -51,11 +64,11 @@ def test_metrics_logging(logger, temp_log_dir):
         success=True
     )
 
+    logger.flush()
+
     # Read the CSV file
     metrics_file = Path(temp_log_dir) / "metrics.csv"
-    with open(metrics_file, 'r') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    rows = _read_rows(metrics_file)
 
     # Verify the logged data
     assert len(rows) == 1
@@ -82,11 +95,11 @@ def test_error_logging(logger, temp_log_dir):
         stack_trace="Traceback info here"
     )
 
+    logger.flush()
+
     # Read the CSV file
     errors_file = Path(temp_log_dir) / "errors.csv"
-    with open(errors_file, 'r') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    rows = _read_rows(errors_file)
 
     # Verify the logged data
     assert len(rows) == 1
@@ -109,11 +122,11 @@ def test_adversarial_logging(logger, temp_log_dir):
         detected_patterns=patterns
     )
 
+    logger.flush()
+
     # Read the CSV file
     adversarial_file = Path(temp_log_dir) / "adversarial.csv"
-    with open(adversarial_file, 'r') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    rows = _read_rows(adversarial_file)
 
     # Verify the logged data
     assert len(rows) == 1
@@ -140,11 +153,11 @@ def test_multiple_logs(logger, temp_log_dir):
             success=True
         )
 
+    logger.flush()
+
     # Read the CSV file
     metrics_file = Path(temp_log_dir) / "metrics.csv"
-    with open(metrics_file, 'r') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    rows = _read_rows(metrics_file)
 
     # Verify multiple entries
     assert len(rows) == 3
@@ -181,6 +194,8 @@ def test_logger_stats(logger, temp_log_dir):
         detected_patterns=["pattern1"]
     )
 
+    logger.flush()
+
     # Check updated stats
     stats = logger.get_stats()
     assert stats["metrics_entries"] == 1
@@ -209,11 +224,11 @@ def test_metrics_from_tracker(logger, temp_log_dir):
         success=True
     )
 
+    logger.flush()
+
     # Read and verify
     metrics_file = Path(temp_log_dir) / "metrics.csv"
-    with open(metrics_file, 'r') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    rows = _read_rows(metrics_file)
 
     assert len(rows) == 1
     row = rows[0]
@@ -251,11 +266,11 @@ def test_thread_safety(logger, temp_log_dir):
     for thread in threads:
         thread.join()
 
+    logger.flush()
+
     # Verify all entries were logged
     metrics_file = Path(temp_log_dir) / "metrics.csv"
-    with open(metrics_file, 'r') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    rows = _read_rows(metrics_file)
 
     # Should have 50 entries (5 threads * 10 logs each)
     assert len(rows) == 50
@@ -311,6 +326,8 @@ def test_newline_stripping(logger, temp_log_dir):
         stack_trace="Traceback (most recent call last):\n  File test.py, line 1\n    error\nValueError: test"
     )
 
+    logger.flush()
+
     # Read the CSV file as raw text
     errors_file = Path(temp_log_dir) / "errors.csv"
     with open(errors_file, 'r') as f:
@@ -320,9 +337,7 @@ def test_newline_stripping(logger, temp_log_dir):
     assert len(lines) == 2, f"Expected 2 lines, got {len(lines)}"
 
     # Read with CSV reader
-    with open(errors_file, 'r') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    rows = _read_rows(errors_file)
 
     assert len(rows) == 1
     row = rows[0]
@@ -352,6 +367,8 @@ def test_newline_stripping_adversarial(logger, temp_log_dir):
                            "Pattern 2\nwith\nanother"]
     )
 
+    logger.flush()
+
     # Read the CSV file as raw text
     adversarial_file = Path(temp_log_dir) / "adversarial.csv"
     with open(adversarial_file, 'r') as f:
@@ -361,9 +378,7 @@ def test_newline_stripping_adversarial(logger, temp_log_dir):
     assert len(lines) == 2, f"Expected 2 lines, got {len(lines)}"
 
     # Read with CSV reader
-    with open(adversarial_file, 'r') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    rows = _read_rows(adversarial_file)
 
     assert len(rows) == 1
     row = rows[0]
@@ -391,6 +406,8 @@ def test_newline_stripping_metrics(logger, temp_log_dir):
         success=True
     )
 
+    logger.flush()
+
     # Read the CSV file as raw text
     metrics_file = Path(temp_log_dir) / "metrics.csv"
     with open(metrics_file, 'r') as f:
@@ -400,9 +417,7 @@ def test_newline_stripping_metrics(logger, temp_log_dir):
     assert len(lines) == 2, f"Expected 2 lines, got {len(lines)}"
 
     # Read with CSV reader
-    with open(metrics_file, 'r') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    rows = _read_rows(metrics_file)
 
     assert len(rows) == 1
     row = rows[0]
@@ -438,11 +453,11 @@ ValueError: Test error"""
         stack_trace=stack_trace
     )
 
+    logger.flush()
+
     # Read the logged error
     errors_file = Path(temp_log_dir) / "errors.csv"
-    with open(errors_file, 'r') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    rows = _read_rows(errors_file)
 
     assert len(rows) == 1
     row = rows[0]
@@ -475,11 +490,11 @@ Exception: API Error"""
         stack_trace=stack_trace
     )
 
+    logger.flush()
+
     # Read the logged error
     errors_file = Path(temp_log_dir) / "errors.csv"
-    with open(errors_file, 'r') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    rows = _read_rows(errors_file)
 
     assert len(rows) == 1
     row = rows[0]
@@ -517,11 +532,11 @@ openai.BadRequestError: Error code: 400"""
         stack_trace=stack_trace
     )
 
+    logger.flush()
+
     # Read the logged error
     errors_file = Path(temp_log_dir) / "errors.csv"
-    with open(errors_file, 'r') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    rows = _read_rows(errors_file)
 
     assert len(rows) == 1
     row = rows[0]
@@ -537,3 +552,36 @@ openai.BadRequestError: Error code: 400"""
     assert str(project_root) not in row["stack_trace"]
     assert '/Users/' not in row["stack_trace"]
     assert 'venv' not in row["stack_trace"]
+
+
+def test_buffered_writes_flush_on_demand(logger, temp_log_dir):
+    """Test that queued rows are durable after an explicit flush."""
+    for i in range(20):
+        logger.log_metrics(
+            model="test-model",
+            latency_ms=i,
+            tokens_prompt=1,
+            tokens_completion=1,
+            tokens_total=2,
+            cost_usd=0.0
+        )
+
+    logger.flush()
+
+    metrics_file = Path(temp_log_dir) / "metrics.csv"
+    rows = _read_rows(metrics_file)
+
+    assert len(rows) == 20
+
+
+def test_close_flushes_pending_rows(temp_log_dir):
+    """Test that close() drains the queue and persists everything."""
+    log = CSVLogger(log_dir=temp_log_dir)
+    log.log_error(error_type="TestError", error_message="boom")
+    log.close()
+
+    errors_file = Path(temp_log_dir) / "errors.csv"
+    rows = _read_rows(errors_file)
+
+    assert len(rows) == 1
+    assert rows[0]["error_type"] == "TestError"
@@ -4,7 +4,11 @@ Tests adversarial prompt detection functionality.
 """
 
 import pytest
-from prompting.safety import AdversarialPromptDetector, check_adversarial_prompt
+from prompting.safety import (
+    AdversarialPromptDetector,
+    check_adversarial_prompt,
+    MAX_INPUT_LENGTH
+)
 
 
 class TestAdversarialPromptDetector:
@@ -99,6 +103,13 @@ class TestCheckAdversarialPrompt:
         assert not is_adversarial
         assert response == {}
 
+    def test_oversized_input_rejected(self):
+        """Test that absurdly large inputs are rejected without scanning."""
+        oversized = "a" * (MAX_INPUT_LENGTH + 1)
+        is_adversarial, response = check_adversarial_prompt(oversized)
+        assert is_adversarial
+        assert "error" in response
+
     def test_case_insensitive_detection(self):
         """Test that detection is case-insensitive."""
         test_cases = [